@@ -1,13 +1,27 @@
 from enum import Enum
+from typing import Any
 
 class Code(Enum):
 
     def __init__(self, code, message):
         self.code = code
         self.message = message
+        self._text = f"{code} {message}"
 
     def __str__(self):
-        return f"{self.code} {self.message}"
+        return self._text
+
+    @classmethod
+    def from_code(cls, code: Any) -> "Code":
+        """Resolves a numeric status (e.g. 429) to its member in O(1). Accepts
+        everything Code() accepts as well, i.e. members and (code, message).
+        Code() itself (and thus pydantic validation) stays strict."""
+        # Only real ints, so 429.0 or True do not resolve to a member.
+        if isinstance(code, int) and not isinstance(code, bool):
+            member = _CODE_BY_NUMBER.get(code)
+            if member is not None:
+                return member
+        return cls(code)
 
     # 2xx Success
     OK = (200, "OK: The request has succeeded.")
@@ -64,4 +78,5 @@ class Code(Enum):
     NOT_EXTENDED = (510, "Not Extended: Further extensions to the request are required for the server to fulfill it.")
     NETWORK_AUTHENTICATION_REQUIRED = (511, "Network Authentication Required: The client needs to authenticate to gain network access.")
 
-    
+
+_CODE_BY_NUMBER = {member.code: member for member in Code}
@@ -1,9 +1,12 @@
 from abc import ABC
+from collections import OrderedDict
 from enum import Enum
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
+import json
+import threading
 import time
-from typing import Any, ClassVar, Dict, TypeVar, Optional
+from typing import Any, ClassVar, Dict, Tuple, TypeVar, Optional
 from fasignalprovider.code import Code
 from fasignalprovider.trading_signal import TradingSignal
 
@@ -62,6 +65,89 @@ class ErrorEvent(Event):
         return data
 
 
+class ErrorResponseCache:
+    """Pre-rendered ErrorEvent payloads keyed by code and detail. Only the
+    event_timestamp is spliced in per call, so answering floods of e.g.
+    TOO_MANY_REQUESTS does not build and serialize a model every time.
+    Payloads without detail are kept for every Code. Payloads with a detail
+    are kept in a LRU of maxsize entries, so attacker-controlled details can
+    neither grow the cache nor push out the common responses."""
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative.")
+        self.maxsize = maxsize
+        self._pinned: Dict[Code, Tuple[Dict[str, Any], str]] = {}
+        self._lru: "OrderedDict[Tuple[Code, str], Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._lru)
+
+    @staticmethod
+    def _render_template(code: Code, detail: Optional[str]) -> Tuple[Dict[str, Any], str]:
+        template = ErrorEvent(code=code, detail=detail).serialize()
+        # Strip the opening brace; the timestamp is prepended per call.
+        return template, json.dumps(template)[1:]
+
+    def _template(self, code: Code, detail: Optional[str]) -> Tuple[Dict[str, Any], str]:
+        if detail is None:
+            template = self._pinned.get(code)
+            if template is None:
+                template = self._pinned[code] = self._render_template(code, None)
+            return template
+        key = (code, detail)
+        with self._lock:
+            template = self._lru.get(key)
+            if template is not None:
+                self._lru.move_to_end(key)
+                return template
+        template = self._render_template(code, detail)
+        with self._lock:
+            self._lru[key] = template
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+        return template
+
+    @staticmethod
+    def _timestamp(event_timestamp: Optional[int]) -> int:
+        # Same coercion as Event.event_timestamp: POSIX milliseconds as int.
+        if event_timestamp is None:
+            return int(time.time() * 1000)
+        return int(event_timestamp)
+
+    def render(
+        self,
+        code: Code,
+        detail: Optional[str] = None,
+        event_timestamp: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Same content as ErrorEvent(code=code, detail=detail).serialize()
+        plus the event_timestamp."""
+        payload = dict(self._template(code, detail)[0])
+        payload["event_timestamp"] = self._timestamp(event_timestamp)
+        return payload
+
+    def render_json(
+        self,
+        code: Code,
+        detail: Optional[str] = None,
+        event_timestamp: Optional[int] = None,
+    ) -> str:
+        """JSON string of render(), built by string concatenation from a
+        pre-dumped template."""
+        body = self._template(code, detail)[1]
+        return '{"event_timestamp": ' + str(self._timestamp(event_timestamp)) + ", " + body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pinned.clear()
+            self._lru.clear()
+
+
+error_response_cache = ErrorResponseCache()
+
+
 ### BUSINESS EVENTS FROM HERE DOWNWARDS ###
 
 
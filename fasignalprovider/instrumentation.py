@@ -0,0 +1,265 @@
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Tags = Dict[str, str]
+_TagKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+VALIDATOR_DURATION = "trading_signal.validator.duration_ms"
+EVENT_COUNT = "event.count"
+REJECTION_REASON_COUNT = "event.rejection_reason.count"
+COLD_REASON_COUNT = "event.cold_reason.count"
+SIGNAL_LATENCY = "trading_signal.latency_ms"
+
+
+class MetricsSink(ABC):
+    """ABSTRACT - A sink receives counters and histogram observations. Implement
+    this to forward metrics to statsd, prometheus, logs, etc."""
+
+    @abstractmethod
+    def increment(self, name: str, tags: Tags, value: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    def observe(self, name: str, value: float, tags: Tags) -> None:
+        pass
+
+
+class NoOpSink(MetricsSink):
+    """The default sink. Discards everything."""
+
+    def increment(self, name: str, tags: Tags, value: int = 1) -> None:
+        pass
+
+    def observe(self, name: str, value: float, tags: Tags) -> None:
+        pass
+
+
+class InMemorySink(MetricsSink):
+    """Keeps all metrics in memory. Meant for tests and debugging."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[_TagKey, int] = defaultdict(int)
+        self.histograms: Dict[_TagKey, List[float]] = defaultdict(list)
+
+    @staticmethod
+    def _key(name: str, tags: Tags) -> _TagKey:
+        return name, tuple(sorted(tags.items()))
+
+    def increment(self, name: str, tags: Tags, value: int = 1) -> None:
+        with self._lock:
+            self.counters[self._key(name, tags)] += value
+
+    def observe(self, name: str, value: float, tags: Tags) -> None:
+        with self._lock:
+            self.histograms[self._key(name, tags)].append(value)
+
+    def count(self, name: str, **tags: str) -> int:
+        return self.counters.get(self._key(name, tags), 0)
+
+    def observations(self, name: str, **tags: str) -> List[float]:
+        return list(self.histograms.get(self._key(name, tags), []))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+_sink: MetricsSink = NoOpSink()
+_enabled: bool = False
+_sample_rate: float = 1.0
+_instrumented_models: List[type] = []
+
+
+def configure(sink: Optional[MetricsSink] = None, sample_rate: float = 1.0) -> None:
+    """Install a sink. Passing None (or a NoOpSink) disables instrumentation.
+    The sample_rate (0..1] applies to histogram observations only; counters are
+    always exact.
+
+    Enabling or disabling swaps the validators of the instrumented models and
+    their subclasses, and force-rebuilds every pydantic model that embeds one,
+    including third-party ones (e.g. own Event subclasses carrying a
+    TradingSignal). Raises RuntimeError if the installed pydantic version no
+    longer offers the internals this relies on."""
+    global _sink, _enabled, _sample_rate
+    if not 0 < sample_rate <= 1:
+        raise ValueError("sample_rate must be within (0, 1].")
+    sink = sink if sink is not None else NoOpSink()
+    enabled = not isinstance(sink, NoOpSink)
+    if enabled != _enabled:
+        _install_validators(enabled)
+    _sink = sink
+    _sample_rate = sample_rate
+    _enabled = enabled
+
+
+def get_sink() -> MetricsSink:
+    return _sink
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _sampled() -> bool:
+    return _sample_rate >= 1 or random.random() < _sample_rate
+
+
+def instrumented_validators(model: type) -> type:
+    """Class decorator for pydantic models. Their field validators, and those of
+    their subclasses, are timed per field while a sink is enabled. While
+    disabled the models keep their original validators, so validation has no
+    overhead at all."""
+    _instrumented_models.append(model)
+    if _enabled:
+        _install_validators(True)
+    return model
+
+
+def _timed(func: Callable) -> Callable:
+    # The ValidationInfo parameter makes pydantic pass the field name. It is
+    # only paid for while instrumentation is enabled.
+    def timed(v, info):
+        if not _sampled():
+            return func(v)
+        start = time.perf_counter()
+        try:
+            return func(v)
+        finally:
+            _sink.observe(
+                VALIDATOR_DURATION,
+                (time.perf_counter() - start) * 1000,
+                {"validator": func.__name__, "field": info.field_name},
+            )
+
+    return timed
+
+
+def _all_subclasses(cls: type) -> List[type]:
+    found: List[type] = []
+    pending = [cls]
+    while pending:
+        current = pending.pop()
+        if current not in found:
+            found.append(current)
+            pending.extend(current.__subclasses__())
+    return found
+
+
+def _check_pydantic_internals(model: type) -> None:
+    # Swapping validators relies on pydantic internals that are not part of its
+    # public API. Fail loudly rather than silently not measuring.
+    decorators = getattr(model, "__pydantic_decorators__", None)
+    field_validators = getattr(decorators, "field_validators", None)
+    if not isinstance(field_validators, dict) or not all(
+        hasattr(decorator, "func") and hasattr(decorator, "cls_var_name")
+        for decorator in field_validators.values()
+    ):
+        raise RuntimeError(
+            "Validator instrumentation is not supported by the installed pydantic version."
+        )
+
+
+def _embedded_models(model: type) -> List[type]:
+    """All model classes referenced anywhere in the core schema of model."""
+    found: List[type] = []
+    pending: List[Any] = [model.__pydantic_core_schema__]
+    seen = set()
+    while pending:
+        node = pending.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, dict):
+            if node.get("type") == "model" and isinstance(node.get("cls"), type):
+                found.append(node["cls"])
+            pending.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            pending.extend(node)
+    return found
+
+
+def _install_validators(enabled: bool) -> None:
+    from pydantic import BaseModel
+
+    instrumented: List[type] = []
+    for root in _instrumented_models:
+        instrumented.extend(m for m in _all_subclasses(root) if m not in instrumented)
+    for model in instrumented:
+        _check_pydantic_internals(model)
+
+    # Pydantic compiles the validators into the model's core schema, hence the
+    # swap needs a rebuild.
+    for model in instrumented:
+        for decorator in model.__pydantic_decorators__.field_validators.values():
+            original = getattr(model, decorator.cls_var_name)
+            decorator.func = _timed(original) if enabled else original
+        model.model_rebuild(force=True)
+
+    # Models embedding an instrumented one copy its core schema, also from
+    # nested models. Rebuild them with their embedded models first.
+    dependencies: Dict[type, List[type]] = {}
+    for model in _all_subclasses(BaseModel):
+        if model in instrumented or not model.__dict__.get("__pydantic_complete__"):
+            continue
+        dependencies[model] = [m for m in _embedded_models(model) if m is not model]
+    stale = set(instrumented)
+    changed = True
+    while changed:
+        changed = False
+        for model, embedded in dependencies.items():
+            if model not in stale and stale.intersection(embedded):
+                stale.add(model)
+                changed = True
+
+    rebuilt = set(instrumented)
+
+    def rebuild(model: type) -> None:
+        rebuilt.add(model)
+        for embedded in dependencies[model]:
+            if embedded in stale and embedded not in rebuilt:
+                rebuild(embedded)
+        model.model_rebuild(force=True)
+
+    for model in dependencies:
+        if model in stale and model not in rebuilt:
+            rebuild(model)
+
+
+def record_event(event: Any) -> None:
+    """Counts the event per type and, where present, per reason for rejection or
+    cold. For trading signal events the latencies between the signal's creation,
+    reception, qualification and rejection are observed in milliseconds."""
+    if not _enabled:
+        return
+    _sink.increment(EVENT_COUNT, {"event_type": event.event_type})
+
+    for reason in getattr(event, "reasons_for_rejection", None) or ():
+        _sink.increment(REJECTION_REASON_COUNT, {"reason": reason.value})
+    for reason in getattr(event, "reasons_for_cold", None) or ():
+        _sink.increment(COLD_REASON_COUNT, {"reason": reason.value})
+
+    date_of_reception = getattr(event, "date_of_reception", None)
+    if date_of_reception is None or not _sampled():
+        return
+    date_of_creation = event.trading_signal.date_of_creation
+    stages = [("creation_to_reception", date_of_creation, date_of_reception)]
+    date_of_qualification = getattr(event, "date_of_qualification", None)
+    if date_of_qualification is not None:
+        stages.append(("reception_to_qualification", date_of_reception, date_of_qualification))
+        stages.append(("creation_to_qualification", date_of_creation, date_of_qualification))
+    date_of_rejection = getattr(event, "date_of_rejection", None)
+    if date_of_rejection is not None:
+        stages.append(("reception_to_rejection", date_of_reception, date_of_rejection))
+        stages.append(("creation_to_rejection", date_of_creation, date_of_rejection))
+    for stage, start, end in stages:
+        _sink.observe(
+            SIGNAL_LATENCY,
+            end - start,
+            {"stage": stage, "event_type": event.event_type},
+        )
@@ -1,10 +1,12 @@
 from pydantic import BaseModel, Field, field_validator
 # from typing import Optional
 from fasignalprovider.direction import Direction
+from fasignalprovider.instrumentation import instrumented_validators
 from fasignalprovider.order_type import OrderType
 from fasignalprovider.side import Side
 
 
+@instrumented_validators
 class TradingSignal(BaseModel):
     """
     A trading signal represents a suggestion to buy or sell. It is issued by a signal supplier
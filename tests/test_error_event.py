@@ -0,0 +1,131 @@
+import json
+import pytest
+from fasignalprovider import event
+from fasignalprovider.code import Code
+from fasignalprovider.event import ErrorEvent, ErrorResponseCache
+
+
+def test_code_lookup_by_number():
+    assert Code.from_code(429) is Code.TOO_MANY_REQUESTS
+    assert Code.from_code(401) is Code.UNAUTHORIZED
+    assert Code(Code.BAD_REQUEST.value) is Code.BAD_REQUEST
+    assert Code.from_code(Code.OK) is Code.OK
+    assert Code.from_code(Code.OK.value) is Code.OK
+
+
+@pytest.mark.parametrize("code", [999, "429", None, 429.0, True])
+def test_code_lookup_unknown(code):
+    with pytest.raises(ValueError):
+        Code.from_code(code)
+    with pytest.raises(ValueError):
+        Code(code)
+
+
+def test_code_constructor_stays_strict():
+    with pytest.raises(ValueError):
+        Code(429)
+    with pytest.raises(ValueError):
+        ErrorEvent(code=429)
+    with pytest.raises(ValueError):
+        ErrorEvent.model_validate_json('{"code": 429}')
+
+
+def test_code_str():
+    assert str(Code.OK) == "200 OK: The request has succeeded."
+
+
+@pytest.mark.parametrize("code", [Code.TOO_MANY_REQUESTS, Code.UNAUTHORIZED, Code.BAD_REQUEST])
+def test_render_matches_serialize(code):
+    cache = ErrorResponseCache()
+    event = ErrorEvent(code=code, detail="slow down")
+    payload = cache.render(code, "slow down", event_timestamp=event.event_timestamp)
+    assert payload == {**event.serialize(), "event_timestamp": event.event_timestamp}
+
+
+def test_render_does_not_leak_timestamps_between_calls():
+    cache = ErrorResponseCache()
+    first = cache.render(Code.TOO_MANY_REQUESTS, event_timestamp=1)
+    second = cache.render(Code.TOO_MANY_REQUESTS, event_timestamp=2)
+    assert first["event_timestamp"] == 1
+    assert second["event_timestamp"] == 2
+
+
+def test_render_and_render_json_agree_on_timestamp():
+    cache = ErrorResponseCache()
+    assert cache.render(Code.OK, event_timestamp=1.7)["event_timestamp"] == 1
+    assert json.loads(cache.render_json(Code.OK, event_timestamp=1.7))["event_timestamp"] == 1
+
+
+def test_render_json():
+    cache = ErrorResponseCache()
+    rendered = cache.render_json(Code.UNAUTHORIZED, "bad token", event_timestamp=123)
+    assert json.loads(rendered) == json.loads(
+        json.dumps(cache.render(Code.UNAUTHORIZED, "bad token", event_timestamp=123))
+    )
+    assert json.loads(cache.render_json(Code.UNAUTHORIZED, "bad token"))["event_timestamp"] > 0
+
+
+@pytest.fixture
+def constructions(monkeypatch):
+    built = []
+
+    def spy(**kwargs):
+        built.append(kwargs)
+        return ErrorEvent(**kwargs)
+
+    monkeypatch.setattr(event, "ErrorEvent", spy)
+    return built
+
+
+def test_render_uses_cached_template(constructions):
+    cache = ErrorResponseCache()
+    cache.render(Code.TOO_MANY_REQUESTS, event_timestamp=1)
+    cache.render_json(Code.TOO_MANY_REQUESTS, event_timestamp=2)
+    cache.render(Code.TOO_MANY_REQUESTS, event_timestamp=3)
+    assert len(constructions) == 1
+
+
+def test_cache_is_bounded():
+    cache = ErrorResponseCache(maxsize=2)
+    for i in range(5):
+        cache.render(Code.BAD_REQUEST, f"detail {i}")
+        cache.render_json(Code.BAD_REQUEST, f"detail {i}")
+    assert len(cache) == 2
+    assert cache.render(Code.BAD_REQUEST, "detail 4")["detail"] == "detail 4"
+
+
+def test_negative_maxsize():
+    with pytest.raises(ValueError):
+        ErrorResponseCache(maxsize=-1)
+
+
+def test_zero_maxsize_caches_only_detail_less_responses(constructions):
+    cache = ErrorResponseCache(maxsize=0)
+    cache.render(Code.OK, "x")
+    cache.render(Code.OK, "x")
+    assert len(constructions) == 2
+    assert len(cache) == 0
+
+
+def test_junk_details_do_not_evict_common_responses(constructions):
+    cache = ErrorResponseCache(maxsize=2)
+    cache.render(Code.TOO_MANY_REQUESTS)
+    for i in range(10):
+        cache.render(Code.BAD_REQUEST, f"junk {i}")
+    del constructions[:]
+    cache.render(Code.TOO_MANY_REQUESTS)
+    cache.render_json(Code.TOO_MANY_REQUESTS)
+    assert constructions == []
+
+
+def test_cache_evicts_least_recently_used(constructions):
+    cache = ErrorResponseCache(maxsize=2)
+    cache.render(Code.UNAUTHORIZED, "bad token")
+    cache.render(Code.BAD_REQUEST, "junk 1")
+    cache.render(Code.UNAUTHORIZED, "bad token")
+    cache.render(Code.BAD_REQUEST, "junk 2")
+    del constructions[:]
+    cache.render(Code.UNAUTHORIZED, "bad token")
+    assert constructions == []
+    cache.render(Code.BAD_REQUEST, "junk 1")
+    assert len(constructions) == 1
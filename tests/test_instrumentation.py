@@ -0,0 +1,191 @@
+from typing import List
+import pytest
+from pydantic import BaseModel
+from fasignalprovider import instrumentation
+from fasignalprovider.direction import Direction
+from fasignalprovider.event import (
+    ReasonForCold,
+    ReasonForRejection,
+    TradingSignalQualifiedCold,
+    TradingSignalReceived,
+    TradingSignalRejected,
+)
+from fasignalprovider.instrumentation import InMemorySink
+from fasignalprovider.side import Side
+from fasignalprovider.trading_signal import TradingSignal
+
+valid_data = {
+    "provider_signal_id": "signal123",
+    "provider_trade_id": "trade123",
+    "provider_id": "provider123",
+    "strategy_id": "strategy123",
+    "market": "BTC/USDT",
+    "data_source": "Binance",
+    "direction": Direction.LONG,
+    "side": Side.BUY,
+    "price": 1000.0,
+    "tp": 1200.0,
+    "sl": 800.0,
+    "position_size_in_percentage": 100,
+    "date_of_creation": 1_000,
+}
+
+
+@pytest.fixture
+def sink():
+    sink = InMemorySink()
+    instrumentation.configure(sink)
+    yield sink
+    instrumentation.configure(None)
+
+
+def test_disabled_records_nothing():
+    sink = InMemorySink()
+    instrumentation.configure(sink)
+    instrumentation.configure(None)
+    signal = TradingSignal(**valid_data)
+    instrumentation.record_event(
+        TradingSignalReceived(
+            trading_signal=signal,
+            internal_signal_id="internal1",
+            ip="127.0.0.1",
+        )
+    )
+    assert not instrumentation.is_enabled()
+    assert not sink.counters
+    assert not sink.histograms
+
+
+def test_disabled_leaves_no_timed_validators_behind(monkeypatch):
+    instrumentation.configure(InMemorySink())
+    instrumentation.configure(None)
+    # A timed validator left installed would report to whatever sink is set,
+    # even while disabled.
+    spy = InMemorySink()
+    monkeypatch.setattr(instrumentation, "_sink", spy)
+    TradingSignal(**valid_data)
+    TradingSignalReceived(trading_signal=valid_data, internal_signal_id="internal1", ip="127.0.0.1")
+    assert not spy.histograms
+
+
+def test_unsupported_pydantic_fails_loudly(monkeypatch):
+    class NotPydantic:
+        pass
+
+    monkeypatch.setattr(instrumentation, "_instrumented_models", [NotPydantic])
+    with pytest.raises(RuntimeError):
+        instrumentation.configure(InMemorySink())
+    assert not instrumentation.is_enabled()
+
+
+def test_validator_timings_per_field(sink):
+    TradingSignal(**valid_data)
+    timings = sink.observations(
+        instrumentation.VALIDATOR_DURATION,
+        validator="check_positive_value",
+        field="price",
+    )
+    assert len(timings) == 1
+    assert timings[0] >= 0
+    assert sink.observations(
+        instrumentation.VALIDATOR_DURATION, validator="check_datetime", field="date_of_creation"
+    )
+
+
+def test_validator_timings_for_subclass_and_own_models():
+    class OwnSignal(TradingSignal):
+        extra: int = 0
+
+    class OwnEnvelope(BaseModel):
+        trading_signal: TradingSignal
+
+    class OwnBatch(BaseModel):
+        envelopes: List[OwnEnvelope]
+
+    sink = InMemorySink()
+    instrumentation.configure(sink)
+    try:
+        for build in (
+            lambda: OwnSignal(**valid_data),
+            lambda: OwnEnvelope(trading_signal=valid_data),
+            lambda: OwnBatch(envelopes=[{"trading_signal": valid_data}]),
+        ):
+            sink.clear()
+            build()
+            assert sink.observations(
+                instrumentation.VALIDATOR_DURATION, validator="check_positive_value", field="price"
+            )
+    finally:
+        instrumentation.configure(None)
+    sink.clear()
+    OwnSignal(**valid_data)
+    OwnBatch(envelopes=[{"trading_signal": valid_data}])
+    assert not sink.histograms
+
+
+def test_validator_timing_recorded_on_failure(sink):
+    with pytest.raises(ValueError):
+        TradingSignal(**{**valid_data, "price": -1})
+    assert sink.observations(
+        instrumentation.VALIDATOR_DURATION, validator="check_positive_value", field="price"
+    )
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        instrumentation.configure(InMemorySink(), sample_rate=0)
+    assert not instrumentation.is_enabled()
+
+
+def test_record_event_counters_and_latencies(sink):
+    received = TradingSignalReceived(
+        trading_signal=TradingSignal(**valid_data),
+        internal_signal_id="internal1",
+        ip="127.0.0.1",
+        date_of_reception=1_500,
+    )
+    rejected = TradingSignalRejected(
+        **received.model_dump(),
+        reasons_for_rejection={ReasonForRejection.SCAM, ReasonForRejection.BANNED_IP},
+        date_of_rejection=1_800,
+    )
+    instrumentation.record_event(received)
+    instrumentation.record_event(rejected)
+
+    assert sink.count(instrumentation.EVENT_COUNT, event_type="trading_signal_received") == 1
+    assert sink.count(instrumentation.EVENT_COUNT, event_type="trading_signal_rejected") == 1
+    assert sink.count(instrumentation.REJECTION_REASON_COUNT, reason="scam") == 1
+    assert sink.count(instrumentation.REJECTION_REASON_COUNT, reason="banned_ip") == 1
+    assert sink.observations(
+        instrumentation.SIGNAL_LATENCY, stage="reception_to_rejection", event_type="trading_signal_rejected"
+    ) == [300]
+    assert sink.observations(
+        instrumentation.SIGNAL_LATENCY, stage="creation_to_rejection", event_type="trading_signal_rejected"
+    ) == [800]
+
+
+def test_record_event_cold_reasons(sink):
+    cold = TradingSignalQualifiedCold(
+        trading_signal=TradingSignal(**valid_data),
+        internal_signal_id="internal1",
+        ip="127.0.0.1",
+        date_of_reception=1_500,
+        date_of_qualification=2_000,
+        reasons_for_cold={ReasonForCold.SYSTEM_IS_COLD},
+    )
+    instrumentation.record_event(cold)
+    assert sink.count(instrumentation.COLD_REASON_COUNT, reason="system_is_cold") == 1
+    assert sink.observations(
+        instrumentation.SIGNAL_LATENCY, stage="creation_to_qualification", event_type="trading_signal_qualified_cold"
+    ) == [1_000]
+
+
+def test_validator_timings_for_nested_signal(sink):
+    TradingSignalReceived(
+        trading_signal=valid_data,
+        internal_signal_id="internal1",
+        ip="127.0.0.1",
+    )
+    assert sink.observations(
+        instrumentation.VALIDATOR_DURATION, validator="check_positive_value", field="tp"
+    )